@@ -0,0 +1,49 @@
+from timeit import timeit
+
+from ddbcereal import Deserializer, Serializer
+
+DYNAMODB_MAX_DEPTH = 32
+NUMBER = 20_000
+
+
+def json_like_document(depth):
+    """A document alternating Maps and Lists down to the requested depth."""
+    document = {'name': 'leaf', 'qty': 1, 'active': True}
+    for level in range(depth - 1):
+        if level % 2:
+            document = {
+                'child': document,
+                'level': level,
+                'label': 'abc',
+                'flags': [True, None],
+            }
+        else:
+            document = [document, 'abc', level]
+    return document
+
+
+def main():
+    recursive_serialize = Serializer().serialize
+    iterative_serialize = Serializer(iterative=True).serialize
+    recursive_deserialize = Deserializer().deserialize
+    iterative_deserialize = Deserializer(iterative=True).deserialize
+
+    for depth in (4, 16, DYNAMODB_MAX_DEPTH):
+        document = json_like_document(depth)
+        serialized = recursive_serialize(document)
+
+        print(f'Serialize document {depth} levels deep')
+        print(f'recursive: '
+              f'{timeit(lambda: recursive_serialize(document), number=NUMBER)}')
+        print(f'iterative: '
+              f'{timeit(lambda: iterative_serialize(document), number=NUMBER)}')
+
+        print(f'Deserialize document {depth} levels deep')
+        print(f'recursive: '
+              f'{timeit(lambda: recursive_deserialize(serialized), number=NUMBER)}')
+        print(f'iterative: '
+              f'{timeit(lambda: iterative_deserialize(serialized), number=NUMBER)}')
+
+
+if __name__ == '__main__':
+    main()
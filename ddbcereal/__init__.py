@@ -15,6 +15,7 @@
 from ddbcereal.deserializing import Deserializer
 from ddbcereal.exceptions import NumberInexactError, NumberNotAllowedError
 from ddbcereal.serializing import Serializer
+from ddbcereal.streaming import ResponseReader
 from ddbcereal.types import DateFormat, DynamoDBType, PythonNumber
 
 VERSION = 2, 1, 1
@@ -41,5 +42,5 @@ __all__ = ('DateFormat', 'DECIMAL_ONLY', 'Deserializer', 'DynamoDBType',
            'FLOAT_ONLY', 'FRACTION_ONLY', 'INT_ONLY', 'INT_OR_DECIMAL',
            'INT_OR_FLOAT', 'ISO_8601', 'MOST_COMPACT', 'NUMBER',
            'NumberInexactError', 'NumberNotAllowedError', 'PythonNumber',
-           'Serializer', 'STRING', 'UNIX_MILLISECONDS', 'UNIX_SECONDS',
+           'ResponseReader', 'Serializer', 'STRING', 'UNIX_MILLISECONDS', 'UNIX_SECONDS',
            'VERSION')
@@ -16,8 +16,8 @@ from binascii import a2b_base64
 from collections.abc import Set
 from decimal import Decimal
 from fractions import Fraction
-from typing import (Any, ByteString, Callable, Mapping, MutableMapping,
-                    Optional, Sequence, Union)
+from typing import (Any, ByteString, Callable, Dict, Iterable, Iterator, List,
+                    Mapping, MutableMapping, Optional, Sequence, Tuple, Union)
 
 from ddbcereal.exceptions import NumberInexactError
 from ddbcereal.types import (DynamoDBSerialValue, DynamoDBTypeSymbol,
@@ -31,18 +31,11 @@ class Deserializer:
         raw_transport=False,
         number_type: PythonNumber = PythonNumber.DECIMAL_ONLY,
         null_value: Any = None,
-        null_factory: Optional[Callable[[], Any]] = None
+        null_factory: Optional[Callable[[], Any]] = None,
+        iterative: bool = False
     ) -> None:
-        if number_type not in inexact_num_deserializers:
-            raise ValueError('Unknown python_number technique.')
-
-        if allow_inexact:
-            self._deserialize_number = inexact_num_deserializers[number_type]
-        elif number_type in exact_num_deserializers:
-            self._deserialize_number = exact_num_deserializers[number_type]
-        else:
-            raise ValueError(f'allow_inexact must be True to use '
-                             f'{number_type}')
+        self._allow_inexact = allow_inexact
+        self._deserialize_number = self._number_deserializer(number_type)
 
         _deserialize_binary: Callable
         if raw_transport:
@@ -59,12 +52,19 @@ class Deserializer:
             def deserialize_null(serial_value):
                 return null_value
 
+        if iterative:
+            _deserialize_list = self._deserialize_list_iteratively
+            _deserialize_map = self._deserialize_map_iteratively
+        else:
+            _deserialize_list = self._deserialize_list
+            _deserialize_map = self._deserialize_map
+
         self._deserializers: MutableMapping[DynamoDBTypeSymbol, Callable] = {
             'B': _deserialize_binary,
             'BS': _deserialize_binary_set,
             'BOOL': deserialize_bool,
-            'L': self._deserialize_list,
-            'M': self._deserialize_map,
+            'L': _deserialize_list,
+            'M': _deserialize_map,
             'N': self._deserialize_number,
             'NS': self._deserialize_number_set,
             'NULL': deserialize_null,
@@ -81,6 +81,55 @@ class Deserializer:
             k: self.deserialize(v) for k, v in item.items()
         }
 
+    def deserialize_items(
+        self,
+        items: Iterable[Mapping[str, DynamoDBValue]]
+    ) -> List[Mapping]:
+        """Deserialize every item of an iterable, e.g. a Query or Scan page.
+        """
+        deserialize = self.deserialize
+        return [
+            {k: deserialize(v) for k, v in item.items()}
+            for item in items
+        ]
+
+    def iter_deserialize_items(
+        self,
+        items: Iterable[Mapping[str, DynamoDBValue]]
+    ) -> Iterator[Mapping]:
+        """Lazily deserialize items as they're drawn from an iterable."""
+        deserialize = self.deserialize
+        for item in items:
+            yield {k: deserialize(v) for k, v in item.items()}
+
+    def compile(
+        self,
+        schema: Mapping[str, Any]
+    ) -> Callable[[Mapping[str, DynamoDBValue]], Dict[str, Any]]:
+        """Generate an item deserializer specialized to a known item shape.
+
+        The schema maps attribute names to Python types, using the same form
+        as :py:meth:`ddbcereal.Serializer.compile`. Number attributes may
+        also be declared with a :py:class:`PythonNumber` to override the
+        deserializer's ``number_type`` for that attribute. Values that don't
+        match their declared type, and attributes missing from the schema,
+        are deserialized with :py:meth:`deserialize`.
+        """
+        return _ItemDeserializerCompiler(self).compile(schema)
+
+    def _number_deserializer(
+        self,
+        number_type: PythonNumber
+    ) -> Callable[[str], Any]:
+        if number_type not in inexact_num_deserializers:
+            raise ValueError('Unknown python_number technique.')
+
+        if self._allow_inexact:
+            return inexact_num_deserializers[number_type]
+        elif number_type in exact_num_deserializers:
+            return exact_num_deserializers[number_type]
+        raise ValueError(f'allow_inexact must be True to use {number_type}')
+
     def _deserialize_number_set(
         self,
         serial_value: Sequence[str]
@@ -99,6 +148,52 @@ class Deserializer:
     ) -> Mapping:
         return {k: self.deserialize(v) for k, v in serial_value.items()}
 
+    def _deserialize_list_iteratively(
+        self,
+        serial_value: Sequence[DynamoDBValue]
+    ) -> Sequence:
+        root: list = []
+        self._deserialize_nested(root, enumerate(serial_value), False)
+        return root
+
+    def _deserialize_map_iteratively(
+        self,
+        serial_value: Mapping[str, DynamoDBValue]
+    ) -> Mapping:
+        root: dict = {}
+        self._deserialize_nested(root, serial_value.items(), True)
+        return root
+
+    def _deserialize_nested(self, root, children, is_map: bool) -> None:
+        """Fill root with deserialized children, descending into Maps and
+        Lists with an explicit stack instead of recursive calls."""
+        deserializers = self._deserializers
+        stack = [(root, iter(children), is_map)]
+        while stack:
+            container, children, is_map = stack[-1]
+            for key, child in children:
+                (type_symbol, serial_value), = child.items()
+                if type_symbol == 'M':
+                    value: Any = {}
+                    stack.append((value, iter(serial_value.items()), True))
+                elif type_symbol == 'L':
+                    value = []
+                    stack.append((value, enumerate(serial_value), False))
+                else:
+                    value = deserializers[type_symbol](serial_value)
+                    if is_map:
+                        container[key] = value
+                    else:
+                        container.append(value)
+                    continue
+                if is_map:
+                    container[key] = value
+                else:
+                    container.append(value)
+                break
+            else:
+                stack.pop()
+
 
 def deserialize_binary(serial_value: Union[bytes, memoryview]) -> ByteString:
     return serial_value
@@ -204,3 +299,130 @@ inexact_num_deserializers = {
     PythonNumber.FRACTION_ONLY: deserialize_number_as_fraction,
     PythonNumber.MOST_COMPACT: deserialize_number_as_most_compact
 }
+python_number_types = {
+    Decimal: PythonNumber.DECIMAL_ONLY,
+    float: PythonNumber.FLOAT_ONLY,
+    Fraction: PythonNumber.FRACTION_ONLY,
+    int: PythonNumber.INT_ONLY,
+}
+
+
+class _ItemDeserializerCompiler:
+    """Writes and compiles Python source for schema-specific item
+    deserializers."""
+    def __init__(self, deserializer: Deserializer) -> None:
+        self._deserializer = deserializer
+        self._namespace: Dict[str, Any] = {
+            'deserialize': deserializer.deserialize
+        }
+
+    def compile(self, schema: Mapping[str, Any]) -> Callable:
+        return self._namespace[self._compile_map(schema)]
+
+    def _bind(self, obj: Any) -> str:
+        name = f'_{len(self._namespace)}'
+        self._namespace[name] = obj
+        return name
+
+    def _compile_map(self, schema: Mapping[str, Any]) -> str:
+        lines = [
+            'def deserialize_item(item):',
+            '    result = {}',
+            '    found = 0',
+        ]
+        for name, attr_schema in schema.items():
+            if not isinstance(name, str):
+                raise TypeError('Attribute names must be strs.')
+            key = repr(name)
+            lines += [
+                f'    if {key} in item:',
+                f'        value = item[{key}]',
+                f'        result[{key}] = {self._expression(attr_schema)}',
+                '        found += 1',
+            ]
+        lines += [
+            '    if found != len(item):',
+            '        for name, value in item.items():',
+            '            if name not in result:',
+            '                result[name] = deserialize(value)',
+            '    return result',
+        ]
+        return self._define('deserialize_item', lines)
+
+    def _compile_element(self, schema: Any) -> str:
+        return self._define('deserialize_element', [
+            'def deserialize_element(value):',
+            f'    return {self._expression(schema)}',
+        ])
+
+    def _define(self, function_name: str, lines: Sequence[str]) -> str:
+        namespace = self._namespace
+        exec('\n'.join(lines), namespace)
+        return self._bind(namespace.pop(function_name))
+
+    def _expression(self, schema: Any) -> str:
+        """Python expression deserializing the DynamoDBValue named value."""
+        try:
+            type_symbol, expression = self._serial_expression(schema)
+        except KeyError:
+            raise TypeError(f'Unsupported schema {schema!r}')
+        if not type_symbol:
+            return 'deserialize(value)'
+        return (f"({expression.format(f'value[{type_symbol!r}]')} "
+                f"if {type_symbol!r} in value else deserialize(value))")
+
+    def _serial_expression(self, schema: Any) -> Tuple[str, str]:
+        """The expected type symbol and an expression template for
+        converting its serial value."""
+        deserializers = self._deserializer._deserializers
+        if isinstance(schema, Mapping):
+            return 'M', f'{self._compile_map(schema)}({{0}})'
+        if isinstance(schema, list):
+            if len(schema) != 1:
+                raise ValueError('List schemas must have exactly one '
+                                 'element schema.')
+            element = self._compile_element(schema[0])
+            return 'L', f'[{element}(element) for element in {{0}}]'
+        if isinstance(schema, (set, frozenset)):
+            if len(schema) != 1:
+                raise ValueError('Set schemas must have exactly one element '
+                                 'type.')
+            element_schema, = schema
+            if element_schema is str:
+                return 'SS', 'set({0})'
+            if element_schema in (bytes, bytearray, memoryview):
+                return 'BS', f"{self._bind(deserializers['BS'])}({{0}})"
+            number = self._bind(self._number_deserializer(element_schema))
+            return 'NS', f'{{{{{number}(n) for n in {{0}}}}}}'
+        if isinstance(schema, PythonNumber) or schema in python_number_types:
+            number = self._bind(self._number_deserializer(schema))
+            return 'N', f'{number}({{0}})'
+        if schema is Any or schema is object or schema in (set, frozenset):
+            return '', ''
+        if schema is None:
+            schema = 'NULL'
+        type_symbol = {
+            bool: 'BOOL',
+            bytearray: 'B',
+            bytes: 'B',
+            dict: 'M',
+            list: 'L',
+            memoryview: 'B',
+            'NULL': 'NULL',
+            str: 'S',
+        }[schema]
+        if type_symbol in ('BOOL', 'S') or (
+            deserializers[type_symbol] is deserialize_binary
+        ):
+            return type_symbol, '{0}'
+        return (type_symbol,
+                f'{self._bind(deserializers[type_symbol])}({{0}})')
+
+    def _number_deserializer(
+        self,
+        schema: Any
+    ) -> Callable[[str], Any]:
+        number_type = python_number_types.get(schema, schema)
+        if not isinstance(number_type, PythonNumber):
+            raise TypeError(f'Unsupported number schema {schema!r}')
+        return self._deserializer._number_deserializer(number_type)
@@ -14,10 +14,13 @@
 
 import decimal
 from binascii import b2a_base64
+from json import JSONEncoder
+from json.encoder import encode_basestring_ascii
 from collections.abc import ByteString, Set
 from datetime import datetime
 from fractions import Fraction
-from typing import Any, Callable, Mapping, MutableMapping, Union, Type
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Mapping,
+                    MutableMapping, Union, Type)
 
 from ddbcereal.exceptions import NumberInexactError, NumberNotAllowedError
 from ddbcereal.types import DateFormat, DynamoDBType, DynamoDBValue
@@ -30,6 +33,10 @@ DDB_NUMBER_PREC = 38
 INFINITY = decimal.Decimal('Infinity')
 NAN = decimal.Decimal('NaN')
 
+ITEM_REQUEST_MEMBERS = frozenset(('ExpressionAttributeValues', 'Item', 'Key'))
+ITEM_LIST_REQUEST_MEMBERS = frozenset(('Keys',))
+VALUE_LIST_REQUEST_MEMBERS = frozenset(('Parameters',))
+
 
 class Serializer:
     """For performing many serializations using the same rules
@@ -43,7 +50,8 @@ class Serializer:
         raw_transport=False,
         datetime_format=DateFormat.ISO_8601,
         fraction_type=DynamoDBType.NUMBER,
-        empty_set_type=DynamoDBType.NUMBER_SET
+        empty_set_type=DynamoDBType.NUMBER_SET,
+        iterative=False
     ) -> None:
         decimal_traps = [
             decimal.Clamped,
@@ -61,9 +69,12 @@ class Serializer:
         if validate_numbers:
             _serialize_float = self._serialize_float_strict
             _serialize_number = self._serialize_number_strict
+            self._float_str: Callable[[Any], str] = self._float_str_strict
+            self._number_str: Callable[[Any], str] = self._number_str_strict
         else:
             _serialize_float = serialize_number
             _serialize_number = serialize_number
+            self._float_str = self._number_str = str
         self._serialize_num = _serialize_number
 
         if fraction_type == DynamoDBType.NUMBER:
@@ -71,6 +82,14 @@ class Serializer:
         else:
             _serialize_fraction = serialize_any_as_string
 
+        if iterative:
+            _serialize_listlike = self._serialize_listlike_iteratively
+            _serialize_mapping = self._serialize_mapping_iteratively
+        else:
+            _serialize_listlike = self._serialize_listlike
+            _serialize_mapping = self._serialize_mapping
+        self._container_methods = _serialize_listlike, _serialize_mapping
+
         self._type_methods: MutableMapping[type, Callable] = {
             bool: serialize_bool,
             bytes: _serialize_bytes,
@@ -78,18 +97,37 @@ class Serializer:
             memoryview: _serialize_bytes,
             datetime: date_serializers[datetime_format],
             decimal.Decimal: _serialize_number,
-            dict: self._serialize_mapping,
+            dict: _serialize_mapping,
             float: _serialize_float,
             Fraction: _serialize_fraction,
             int: _serialize_number,
-            list: self._serialize_listlike,
-            Mapping: self._serialize_mapping,
+            list: _serialize_listlike,
+            Mapping: _serialize_mapping,
             NoneType: serialize_none,
-            tuple: self._serialize_listlike,
+            tuple: _serialize_listlike,
             frozenset: self._serialize_set,
             set: self._serialize_set,
             str: serialize_str,
         }
+        self._json_writers: MutableMapping[type, Callable] = {
+            bool: write_bool_json,
+            bytes: write_bytes_json,
+            bytearray: write_bytes_json,
+            memoryview: write_bytes_json,
+            datetime: self._write_serialized_json,
+            decimal.Decimal: self._write_number_json,
+            dict: self._write_mapping_json,
+            float: self._write_float_json,
+            Fraction: self._write_serialized_json,
+            int: self._write_number_json,
+            list: self._write_listlike_json,
+            Mapping: self._write_mapping_json,
+            NoneType: write_none_json,
+            tuple: self._write_listlike_json,
+            frozenset: self._write_serialized_json,
+            set: self._write_serialized_json,
+            str: write_str_json,
+        }
 
         decimal_ctx = decimal.Context(
             Emin=DDB_NUMBER_EMIN,
@@ -122,6 +160,173 @@ class Serializer:
     ) -> Mapping[str, DynamoDBValue]:
         return {k: self.serialize(v) for k, v in item.items()}
 
+    def serialize_items(
+        self,
+        items: Iterable[Mapping[str, Any]]
+    ) -> List[Mapping[str, DynamoDBValue]]:
+        """Serialize every item of an iterable."""
+        serialize = self.serialize
+        return [
+            {k: serialize(v) for k, v in item.items()}
+            for item in items
+        ]
+
+    def iter_serialize_items(
+        self,
+        items: Iterable[Mapping[str, Any]]
+    ) -> Iterator[Mapping[str, DynamoDBValue]]:
+        """Lazily serialize items as they're drawn from an iterable."""
+        serialize = self.serialize
+        for item in items:
+            yield {k: serialize(v) for k, v in item.items()}
+
+    def compile(
+        self,
+        schema: Mapping[str, Any]
+    ) -> Callable[[Mapping[str, Any]], Dict[str, DynamoDBValue]]:
+        """Generate an item serializer specialized to a known item shape.
+
+        The schema maps attribute names to Python types. A nested dict
+        describes a Map, a single-element list describes a List of that
+        element schema and a single-element set describes a Set. Values
+        that don't match their declared type, and attributes missing from
+        the schema, are serialized with :py:meth:`serialize`.
+        """
+        return _ItemSerializerCompiler(self).compile(schema)
+
+    def dumps_item(self, item: Mapping[str, Any]) -> bytes:
+        """Serialize an item straight to DynamoDB JSON text encoded as UTF-8,
+        ready to be sent to the DynamoDB HTTP API. Binary values are encoded
+        as Base 64 regardless of the ``raw_transport`` option.
+        """
+        parts: List[str] = []
+        self._write_item_json(item, parts.append)
+        return ''.join(parts).encode()
+
+    def dumps_request(self, request: Mapping[str, Any]) -> bytes:
+        """Write a DynamoDB HTTP API request body as UTF-8 JSON text.
+
+        Python values under ``Item``, ``Key``, ``Keys``,
+        ``ExpressionAttributeValues`` and ``Parameters`` request members are
+        serialized as they're written. All other members, including
+        ``ExclusiveStartKey``, are written as plain JSON.
+        """
+        parts: List[str] = []
+        self._write_request_json(request, parts.append)
+        return ''.join(parts).encode()
+
+    def _write_json(self, value: Any, write: Callable[[str], Any]) -> None:
+        value_type = type(value)
+        try:
+            writer = self._json_writers[value_type]
+        except KeyError:
+            for type_route, writer in self._json_writers.items():
+                if issubclass(value_type, type_route):
+                    self._json_writers[value_type] = writer
+                    return writer(value, write)
+        else:
+            return writer(value, write)
+        raise TypeError('Not a DynamoDB-serializable type.')
+
+    def _write_item_json(
+        self,
+        item: Mapping[str, Any],
+        write: Callable[[str], Any]
+    ) -> None:
+        write_json = self._write_json
+        separator = '{'
+        for k, v in item.items():
+            write(separator + encode_basestring_ascii(k) + ':')
+            write_json(v, write)
+            separator = ','
+        write('}' if separator == ',' else '{}')
+
+    def _write_mapping_json(
+        self,
+        value: Mapping,
+        write: Callable[[str], Any]
+    ) -> None:
+        write('{"M":')
+        self._write_item_json(value, write)
+        write('}')
+
+    def _write_listlike_json(
+        self,
+        value: Union[list, tuple],
+        write: Callable[[str], Any]
+    ) -> None:
+        write_json = self._write_json
+        separator = '{"L":['
+        for element in value:
+            write(separator)
+            write_json(element, write)
+            separator = ','
+        write(']}' if separator == ',' else '{"L":[]}')
+
+    def _write_number_json(
+        self,
+        value: Union[int, decimal.Decimal],
+        write: Callable[[str], Any]
+    ) -> None:
+        write('{"N":"' + self._number_str(value) + '"}')
+
+    def _write_float_json(
+        self,
+        value: float,
+        write: Callable[[str], Any]
+    ) -> None:
+        write('{"N":"' + self._float_str(value) + '"}')
+
+    def _write_serialized_json(
+        self,
+        value: Any,
+        write: Callable[[str], Any]
+    ) -> None:
+        write(_json_encoder.encode(self.serialize(value)))
+
+    def _write_request_json(
+        self,
+        value: Any,
+        write: Callable[[str], Any],
+        table_names: bool = False
+    ) -> None:
+        if isinstance(value, Mapping):
+            separator = '{'
+            for k, v in value.items():
+                write(separator + encode_basestring_ascii(k) + ':')
+                separator = ','
+                if table_names:
+                    self._write_request_json(v, write)
+                elif k in ITEM_REQUEST_MEMBERS:
+                    self._write_item_json(v, write)
+                elif k in ITEM_LIST_REQUEST_MEMBERS:
+                    write('[')
+                    for index, element in enumerate(v):
+                        if index:
+                            write(',')
+                        self._write_item_json(element, write)
+                    write(']')
+                elif k in VALUE_LIST_REQUEST_MEMBERS:
+                    write('[')
+                    for index, element in enumerate(v):
+                        if index:
+                            write(',')
+                        self._write_json(element, write)
+                    write(']')
+                else:
+                    self._write_request_json(v, write,
+                                             k == 'RequestItems')
+            write('}' if separator == ',' else '{}')
+        elif isinstance(value, (list, tuple)):
+            write('[')
+            for index, element in enumerate(value):
+                if index:
+                    write(',')
+                self._write_request_json(element, write)
+            write(']')
+        else:
+            write(_json_encoder.encode(value))
+
     def _serialize_fraction_as_number(self, value: Fraction):
         try:
             return {
@@ -134,25 +339,31 @@ class Serializer:
         self,
         value: Union[int, float, decimal.Decimal]
     ):
-        try:
-            dec_value = self._create_decimal(value)
-        except decimal.Inexact:
-            raise NumberInexactError()
-        if dec_value in (INFINITY, NAN):
-            raise NumberNotAllowedError(f'{dec_value} not supported')
-        return {'N': str(dec_value)}
+        return {'N': self._number_str_strict(value)}
 
     def _serialize_float_strict(
         self,
         value: Union[int, float, decimal.Decimal]
     ):
+        return {'N': self._float_str_strict(value)}
+
+    def _number_str_strict(
+        self,
+        value: Union[int, float, decimal.Decimal]
+    ) -> str:
         try:
-            dec_value = self._create_decimal(str(value))
+            dec_value = self._create_decimal(value)
         except decimal.Inexact:
             raise NumberInexactError()
         if dec_value in (INFINITY, NAN):
             raise NumberNotAllowedError(f'{dec_value} not supported')
-        return {'N': str(dec_value)}
+        return str(dec_value)
+
+    def _float_str_strict(
+        self,
+        value: Union[int, float, decimal.Decimal]
+    ) -> str:
+        return self._number_str_strict(str(value))
 
     def _serialize_listlike(self, value: Union[list, tuple]):
         return {'L': [self.serialize(element) for element in value]}
@@ -181,6 +392,52 @@ class Serializer:
             'M': {k: self.serialize(v) for k, v in value.items()}
         }
 
+    def _serialize_listlike_iteratively(self, value: Union[list, tuple]):
+        root: list = []
+        self._serialize_nested(root, enumerate(value), False)
+        return {'L': root}
+
+    def _serialize_mapping_iteratively(self, value: Mapping):
+        root: dict = {}
+        self._serialize_nested(root, value.items(), True)
+        return {'M': root}
+
+    def _serialize_nested(self, root, children, is_map: bool) -> None:
+        """Fill root with serialized children, descending into Maps and
+        Lists with an explicit stack instead of recursive calls."""
+        type_methods = self._type_methods
+        serialize_listlike, serialize_mapping = self._container_methods
+        stack = [(root, iter(children), is_map)]
+        while stack:
+            container, children, is_map = stack[-1]
+            for key, child in children:
+                method = type_methods.get(type(child))
+                if method is serialize_mapping:
+                    nested: Any = {}
+                    value = {'M': nested}
+                    stack.append((nested, iter(child.items()), True))
+                elif method is serialize_listlike:
+                    nested = []
+                    value = {'L': nested}
+                    stack.append((nested, enumerate(child), False))
+                else:
+                    if method is None:
+                        value = self.serialize(child)
+                    else:
+                        value = method(child)
+                    if is_map:
+                        container[key] = value
+                    else:
+                        container.append(value)
+                    continue
+                if is_map:
+                    container[key] = value
+                else:
+                    container.append(value)
+                break
+            else:
+                stack.pop()
+
 
 def serialize_bool(value: bool):
     return {'BOOL': value}
@@ -231,3 +488,131 @@ date_serializers = {
     DateFormat.UNIX_MILLISECONDS: serialize_datetime_as_unix_milliseconds,
     DateFormat.ISO_8601: serialize_datetime_as_iso_8601_string
 }
+
+
+def write_bool_json(value: bool, write: Callable[[str], Any]) -> None:
+    write('{"BOOL":true}' if value else '{"BOOL":false}')
+
+
+def write_bytes_json(
+    value: Union[bytes, memoryview],
+    write: Callable[[str], Any]
+) -> None:
+    write('{"B":"' + b2a_base64(value, newline=False).decode('ascii') + '"}')
+
+
+def write_none_json(value: None, write: Callable[[str], Any]) -> None:
+    write('{"NULL":true}')
+
+
+def write_str_json(value: str, write: Callable[[str], Any]) -> None:
+    write('{"S":' + encode_basestring_ascii(value) + '}')
+
+
+def encode_bytes_as_base64(value: Any) -> str:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return b2a_base64(value, newline=False).decode('ascii')
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+
+_json_encoder = JSONEncoder(separators=(',', ':'),
+                            default=encode_bytes_as_base64)
+
+
+class _ItemSerializerCompiler:
+    """Writes and compiles Python source for schema-specific item
+    serializers."""
+    inline_templates: Mapping[Callable, str] = {
+        serialize_bool: "{{'BOOL': {0}}}",
+        serialize_none: "{{'NULL': True}}",
+        serialize_number: "{{'N': str({0})}}",
+        serialize_str: "{{'S': {0}}}",
+    }
+
+    def __init__(self, serializer: Serializer) -> None:
+        self._serializer = serializer
+        self._namespace: Dict[str, Any] = {
+            'serialize': serializer.serialize
+        }
+
+    def compile(self, schema: Mapping[str, Any]) -> Callable:
+        return self._namespace[self._compile_map(schema)]
+
+    def _bind(self, obj: Any) -> str:
+        name = f'_{len(self._namespace)}'
+        self._namespace[name] = obj
+        return name
+
+    def _compile_map(self, schema: Mapping[str, Any]) -> str:
+        lines = [
+            'def serialize_item(item):',
+            '    result = {}',
+            '    found = 0',
+        ]
+        for name, attr_schema in schema.items():
+            if not isinstance(name, str):
+                raise TypeError('Attribute names must be strs.')
+            key = repr(name)
+            lines += [
+                f'    if {key} in item:',
+                f'        value = item[{key}]',
+                f'        result[{key}] = '
+                f'{self._expression(attr_schema, "value", 0)}',
+                '        found += 1',
+            ]
+        lines += [
+            '    if found != len(item):',
+            '        for name, value in item.items():',
+            '            if name not in result:',
+            '                result[name] = serialize(value)',
+            '    return result',
+        ]
+        namespace = self._namespace
+        exec('\n'.join(lines), namespace)
+        return self._bind(namespace.pop('serialize_item'))
+
+    def _expression(self, schema: Any, var: str, depth: int) -> str:
+        if isinstance(schema, Mapping):
+            return (f"({{'M': {self._compile_map(schema)}({var})}} "
+                    f"if type({var}) is dict else serialize({var}))")
+        if isinstance(schema, list):
+            if len(schema) != 1:
+                raise ValueError('List schemas must have exactly one '
+                                 'element schema.')
+            element_var = f'e{depth}'
+            element = self._expression(schema[0], element_var, depth + 1)
+            return (f"({{'L': [{element} for {element_var} in {var}]}} "
+                    f"if type({var}) is list else serialize({var}))")
+        if isinstance(schema, (set, frozenset)):
+            if len(schema) != 1:
+                raise ValueError('Set schemas must have exactly one element '
+                                 'type.')
+            schema = set
+        elif schema is None:
+            schema = NoneType
+        elif schema is Any or schema is object:
+            return f'serialize({var})'
+        if not isinstance(schema, type):
+            raise TypeError(f'Unsupported schema {schema!r}')
+
+        method = self._type_method(schema)
+        template = self.inline_templates.get(method)
+        if template:
+            expression = template.format(var)
+        else:
+            expression = f'{self._bind(method)}({var})'
+        if schema is NoneType:
+            guard = f'{var} is None'
+        else:
+            guard = f'type({var}) is {self._bind(schema)}'
+        return f'({expression} if {guard} else serialize({var}))'
+
+    def _type_method(self, schema: type) -> Callable:
+        type_methods = self._serializer._type_methods
+        try:
+            return type_methods[schema]
+        except KeyError:
+            for type_route, method in type_methods.items():
+                if issubclass(schema, type_route):
+                    return method
+        raise TypeError('Not a DynamoDB-serializable type.')
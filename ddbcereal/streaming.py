@@ -0,0 +1,201 @@
+#  Copyright 2021 Justin Arthur
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import codecs
+import re
+from json import JSONDecodeError, JSONDecoder
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+
+from ddbcereal.deserializing import Deserializer
+from ddbcereal.types import DynamoDBValue
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_SCALAR_END = re.compile(r'[,}\] \t\n\r]')
+
+_decode_json = JSONDecoder().raw_decode
+
+# Parser states:
+_OBJECT_START = 0
+_MEMBER_NAME = 1
+_NAME_SEPARATOR = 2
+_MEMBER_VALUE = 3
+_AFTER_MEMBER = 4
+_ITEM = 5
+_AFTER_ITEM = 6
+_DONE = 7
+
+
+class ResponseReader:
+    """Incrementally parses the JSON body of a DynamoDB HTTP API Query or Scan
+    response, deserializing each member of ``Items`` as soon as all of its
+    bytes have been fed to the reader.
+
+    The supplied deserializer should be constructed with
+    ``raw_transport=True``. All response members other than ``Items`` are
+    kept as plain JSON values in :py:attr:`members`.
+    """
+    def __init__(self, deserializer: Deserializer) -> None:
+        self.members: Dict[str, Any] = {}
+        self._deserialize_item = deserializer.deserialize_item
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._state = _OBJECT_START
+        self._member_name = ''
+        self._retry_size = 0
+
+    @property
+    def count(self) -> Optional[int]:
+        return self.members.get('Count')
+
+    @property
+    def scanned_count(self) -> Optional[int]:
+        return self.members.get('ScannedCount')
+
+    @property
+    def last_evaluated_key(self) -> Optional[Mapping[str, DynamoDBValue]]:
+        """The raw key to send as ``ExclusiveStartKey`` for the next page."""
+        return self.members.get('LastEvaluatedKey')
+
+    def feed(self, data: bytes) -> List[Mapping]:
+        """Parse the next chunk of the response, returning any items it
+        completed."""
+        text = self._text_decoder.decode(data)
+        if self._pos:
+            self._buffer = self._buffer[self._pos:] + text
+            self._pos = 0
+        else:
+            self._buffer += text
+        return self._parse(final=False)
+
+    def close(self) -> List[Mapping]:
+        """Signal the end of the response, returning any remaining items.
+
+        Raises :py:exc:`ValueError` if the response was incomplete.
+        """
+        self._buffer += self._text_decoder.decode(b'', final=True)
+        items = self._parse(final=True)
+        if self._state != _DONE:
+            raise ValueError('Incomplete DynamoDB response.')
+        return items
+
+    def read(self, chunks: Iterable[bytes]) -> Iterator[Mapping]:
+        """Feed every chunk of a response, yielding deserialized items as
+        they're completed."""
+        for chunk in chunks:
+            yield from self.feed(chunk)
+        yield from self.close()
+
+    def _parse(self, final: bool) -> List[Mapping]:
+        items = []
+        buffer = self._buffer
+        pos = self._pos
+        state = self._state
+        buffer_len = len(buffer)
+        skip_whitespace = _WHITESPACE.match
+        while True:
+            pos = skip_whitespace(buffer, pos).end()
+            if pos == buffer_len:
+                break
+            char = buffer[pos]
+            if state == _ITEM:
+                if char == ']':
+                    pos += 1
+                    state = _AFTER_MEMBER
+                    continue
+                decoded = self._decode_value(buffer, pos, final)
+                if not decoded:
+                    break
+                item, pos = decoded
+                items.append(self._deserialize_item(item))
+                state = _AFTER_ITEM
+            elif state == _AFTER_ITEM:
+                if char == ',':
+                    state = _ITEM
+                elif char == ']':
+                    state = _AFTER_MEMBER
+                else:
+                    raise ValueError(f'Unexpected {char!r} in Items.')
+                pos += 1
+            elif state == _MEMBER_VALUE:
+                if self._member_name == 'Items':
+                    if char != '[':
+                        raise ValueError('Items must be an array.')
+                    pos += 1
+                    state = _ITEM
+                    continue
+                decoded = self._decode_value(buffer, pos, final)
+                if not decoded:
+                    break
+                self.members[self._member_name], pos = decoded
+                state = _AFTER_MEMBER
+            elif state == _MEMBER_NAME:
+                if char == '}':
+                    pos += 1
+                    state = _DONE
+                    continue
+                decoded = self._decode_value(buffer, pos, final)
+                if not decoded:
+                    break
+                self._member_name, pos = decoded
+                state = _NAME_SEPARATOR
+            elif state == _NAME_SEPARATOR:
+                if char != ':':
+                    raise ValueError(f'Unexpected {char!r} after member '
+                                     f'name.')
+                pos += 1
+                state = _MEMBER_VALUE
+            elif state == _AFTER_MEMBER:
+                if char == ',':
+                    state = _MEMBER_NAME
+                elif char == '}':
+                    state = _DONE
+                else:
+                    raise ValueError(f'Unexpected {char!r} after member.')
+                pos += 1
+            elif state == _OBJECT_START:
+                if char != '{':
+                    raise ValueError('Response must be a JSON object.')
+                pos += 1
+                state = _MEMBER_NAME
+            else:
+                raise ValueError('Extra data after the response.')
+        self._pos = pos
+        self._state = state
+        return items
+
+    def _decode_value(self, buffer: str, pos: int, final: bool):
+        """Decode the JSON value starting at pos, returning the value and the
+        position after it, or None if more data is needed."""
+        pending_size = len(buffer) - pos
+        if not final:
+            if pending_size < self._retry_size:
+                # Wait for a substantial amount of new data before attempting
+                # this value again to keep parsing time linear.
+                return None
+            if (
+                buffer[pos] not in '{["tfn'
+                and not _SCALAR_END.search(buffer, pos)
+            ):
+                # A Number could be continued by the next chunk.
+                return None
+        try:
+            decoded = _decode_json(buffer, pos)
+        except JSONDecodeError:
+            if final:
+                raise
+            self._retry_size = pending_size * 2
+            return None
+        self._retry_size = 0
+        return decoded
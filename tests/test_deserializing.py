@@ -47,8 +47,9 @@ def test_item():
     ) == {'key1': None, 'key2': 'Hello'}
 
 
-def test_map():
-    deserializer = Deserializer()
+@pytest.mark.parametrize('iterative', [False, True])
+def test_map(iterative):
+    deserializer = Deserializer(iterative=iterative)
     assert deserializer.deserialize(
         {
             'M': {
@@ -205,3 +206,98 @@ def test_most_compact():
             == Decimal('1.1000000000000000888178419700125232339'))
     assert (deserializer.deserialize(NUM_TRICKY_PRECISION)
             == 0x1249ad2594c37ceb0b2784c4ce0bf38ace408e211a7caab24308a82e8f10000000000000000000000000)
+
+
+def test_compiled_item():
+    deserializer = Deserializer()
+    deserialize_order = deserializer.compile({
+        'id': str,
+        'count': int,
+        'total': Decimal,
+        'ratio': PythonNumber.INT_OR_DECIMAL,
+        'tags': {str},
+        'sizes': {int},
+        'lines': [{'sku': str, 'qty': int}],
+    })
+    assert deserialize_order({
+        'id': {'S': 'order-1'},
+        'count': {'N': '2'},
+        'total': {'N': '10.50'},
+        'ratio': {'N': '3'},
+        'tags': {'SS': ['rush']},
+        'sizes': {'NS': ['8', '10']},
+        'lines': {'L': [
+            {'M': {'sku': {'S': 'abc'}, 'qty': {'N': '2'}}},
+            {'M': {'sku': {'S': 'def'}, 'qty': {'N': '1'}}},
+        ]},
+    }) == {
+        'id': 'order-1',
+        'count': 2,
+        'total': Decimal('10.50'),
+        'ratio': 3,
+        'tags': {'rush'},
+        'sizes': {8, 10},
+        'lines': [{'sku': 'abc', 'qty': 2}, {'sku': 'def', 'qty': 1}],
+    }
+
+
+def test_compiled_item_fallback():
+    deserializer = Deserializer()
+    deserialize_item = deserializer.compile({'id': str, 'qty': int})
+
+    # Mismatched types, missing and undeclared attributes:
+    assert deserialize_item({
+        'id': {'N': '42'},
+        'extra': {'S': 'abc'}
+    }) == {'id': Decimal('42'), 'extra': 'abc'}
+    assert deserialize_item({}) == {}
+
+    with pytest.raises(ValueError):
+        deserialize_item({'qty': NUM_SHORT_DECIMAL})
+
+
+def test_compile_invalid_schema():
+    deserializer = Deserializer()
+    with pytest.raises(TypeError):
+        deserializer.compile({'id': complex})
+    with pytest.raises(ValueError):
+        deserializer.compile({'ratio': float})
+
+
+def test_items():
+    deserializer = Deserializer()
+    items = [
+        {'id': {'S': 'a'}, 'qty': NUM_SMALL_INT},
+        {'id': {'S': 'b'}, 'level2': {'M': {'isTrue': {'BOOL': True}}}},
+    ]
+    expected = [
+        {'id': 'a', 'qty': Decimal('42')},
+        {'id': 'b', 'level2': {'isTrue': True}},
+    ]
+    assert deserializer.deserialize_items(items) == expected
+    assert deserializer.deserialize_items(iter(items)) == expected
+
+    deserialized = deserializer.iter_deserialize_items(iter(items))
+    assert next(deserialized) == expected[0]
+    assert list(deserialized) == expected[1:]
+
+
+def test_iterative_deep_document():
+    recursive_deserializer = Deserializer()
+    iterative_deserializer = Deserializer(iterative=True)
+    document = {'M': {'leaf': {'S': 'abc'}}}
+    for level in range(32):
+        document = {'M': {
+            'child': document,
+            'siblings': {'L': [{'N': str(level)}, document, {'L': []}]}
+        }}
+    assert (iterative_deserializer.deserialize(document)
+            == recursive_deserializer.deserialize(document))
+
+    document = {'L': []}
+    for level in range(5000):
+        document = {'L': [document]}
+    deserialized = iterative_deserializer.deserialize(document)
+    for level in range(5000):
+        deserialized, = deserialized
+    assert deserialized == []
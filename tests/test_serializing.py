@@ -1,3 +1,4 @@
+import json
 from decimal import Decimal
 from fractions import Fraction
 
@@ -102,12 +103,16 @@ def test_bools():
     assert serializer.serialize(False) == {'BOOL': False}
 
 
-def test_lists():
-    serializer = Serializer()
+@pytest.mark.parametrize('iterative', [False, True])
+def test_lists(iterative):
+    serializer = Serializer(iterative=iterative)
     assert serializer.serialize([1, 'abc', None, None, True]) == {
         'L': [{'N': '1'}, {'S': 'abc'}, {'NULL': True}, {'NULL': True},
               {'BOOL': True}]
     }
+    assert serializer.serialize([[], ([{}],), 'abc']) == {
+        'L': [{'L': []}, {'L': [{'L': [{'M': {}}]}]}, {'S': 'abc'}]
+    }
 
 
 def test_sets():
@@ -127,8 +132,9 @@ def test_sets():
     assert set(serialized_ss['SS']) == {'123', 'abc'}
 
 
-def test_maps():
-    serializer = Serializer()
+@pytest.mark.parametrize('iterative', [False, True])
+def test_maps(iterative):
+    serializer = Serializer(iterative=iterative)
     assert serializer.serialize({
         'this': 'that',
         'another': 123,
@@ -152,3 +158,153 @@ def test_item():
         'another': {'N': '123'},
         'level2': {'M': {'isTrue': {'BOOL': True}}}
     }
+
+
+def test_compiled_item():
+    serializer = Serializer()
+    serialize_order = serializer.compile({
+        'id': str,
+        'total': Decimal,
+        'paid': bool,
+        'note': None,
+        'tags': {str},
+        'lines': [{'sku': str, 'qty': int}],
+    })
+    order = {
+        'id': 'order-1',
+        'total': Decimal('10.50'),
+        'paid': False,
+        'note': None,
+        'tags': {'rush'},
+        'lines': [{'sku': 'abc', 'qty': 2}, {'sku': 'def', 'qty': 1}],
+    }
+    assert serialize_order(order) == serializer.serialize_item(order) == {
+        'id': {'S': 'order-1'},
+        'total': {'N': '10.50'},
+        'paid': {'BOOL': False},
+        'note': {'NULL': True},
+        'tags': {'SS': ['rush']},
+        'lines': {'L': [
+            {'M': {'sku': {'S': 'abc'}, 'qty': {'N': '2'}}},
+            {'M': {'sku': {'S': 'def'}, 'qty': {'N': '1'}}},
+        ]},
+    }
+
+
+def test_compiled_item_fallback():
+    serializer = Serializer()
+    serialize_item = serializer.compile({'id': str, 'level2': {'qty': int}})
+
+    # Mismatched types, missing and undeclared attributes:
+    assert serialize_item({
+        'id': 42,
+        'level2': {'qty': True},
+        'extra': 'abc'
+    }) == {
+        'id': {'N': '42'},
+        'level2': {'M': {'qty': {'BOOL': True}}},
+        'extra': {'S': 'abc'}
+    }
+    assert serialize_item({}) == {}
+
+    with pytest.raises(NumberInexactError):
+        serialize_item({'level2': {'qty': BIG_INVALID_INT}})
+
+
+def test_compile_invalid_schema():
+    serializer = Serializer()
+    with pytest.raises(TypeError):
+        serializer.compile({'id': complex})
+    with pytest.raises(ValueError):
+        serializer.compile({'ids': [str, int]})
+
+
+def test_items():
+    serializer = Serializer()
+    items = [{'id': 'a', 'qty': 1}, {'id': 'b', 'tags': {'x'}}]
+    expected = [
+        {'id': {'S': 'a'}, 'qty': {'N': '1'}},
+        {'id': {'S': 'b'}, 'tags': {'SS': ['x']}},
+    ]
+    assert serializer.serialize_items(items) == expected
+    assert serializer.serialize_items(iter(items)) == expected
+
+    serialized = serializer.iter_serialize_items(iter(items))
+    assert next(serialized) == expected[0]
+    assert list(serialized) == expected[1:]
+
+
+def test_dumps_item():
+    serializer = Serializer()
+    raw_serializer = Serializer(raw_transport=True)
+    item = {
+        'id': 'caf\u00e9 "quoted"',
+        'qty': 42,
+        'price': Decimal('1.50'),
+        'blob': b'test',
+        'flags': [True, False, None],
+        'level2': {'tags': {'abc'}, 'empty': {}, 'bins': {b'test'}},
+        'ratio': Fraction(1, 4),
+    }
+    expected = json.dumps(raw_serializer.serialize_item(item),
+                          separators=(',', ':')).encode()
+    assert serializer.dumps_item(item) == expected
+    assert raw_serializer.dumps_item(item) == expected
+    assert serializer.dumps_item({}) == b'{}'
+
+    with pytest.raises(NumberInexactError):
+        serializer.dumps_item({'qty': BIG_INVALID_INT})
+
+
+def test_dumps_request():
+    serializer = Serializer()
+    assert json.loads(serializer.dumps_request({
+        'TableName': 'Orders',
+        'Key': {'id': 'abc'},
+        'UpdateExpression': 'SET qty = :qty',
+        'ExpressionAttributeValues': {':qty': 5},
+        'ExclusiveStartKey': {'id': {'S': 'xyz'}},
+    })) == {
+        'TableName': 'Orders',
+        'Key': {'id': {'S': 'abc'}},
+        'UpdateExpression': 'SET qty = :qty',
+        'ExpressionAttributeValues': {':qty': {'N': '5'}},
+        'ExclusiveStartKey': {'id': {'S': 'xyz'}},
+    }
+
+    assert json.loads(serializer.dumps_request({
+        'RequestItems': {
+            'Item': [
+                {'PutRequest': {'Item': {'id': 'abc', 'blob': b'test'}}},
+                {'DeleteRequest': {'Key': {'id': 'def'}}},
+            ],
+            'Orders': {'Keys': [{'id': 'abc'}]},
+        }
+    })) == {
+        'RequestItems': {
+            'Item': [
+                {'PutRequest': {'Item': {'id': {'S': 'abc'},
+                                         'blob': {'B': 'dGVzdA=='}}}},
+                {'DeleteRequest': {'Key': {'id': {'S': 'def'}}}},
+            ],
+            'Orders': {'Keys': [{'id': {'S': 'abc'}}]},
+        }
+    }
+
+
+def test_iterative_deep_document():
+    recursive_serializer = Serializer()
+    iterative_serializer = Serializer(iterative=True)
+    document = {'leaf': 'abc'}
+    for level in range(32):
+        document = {'child': document, 'siblings': [level, document, 'abc']}
+    assert (iterative_serializer.serialize(document)
+            == recursive_serializer.serialize(document))
+
+    document = []
+    for level in range(5000):
+        document = [document]
+    serialized = iterative_serializer.serialize(document)
+    for level in range(5000):
+        serialized, = serialized['L']
+    assert serialized == {'L': []}
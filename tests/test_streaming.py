@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from ddbcereal.deserializing import Deserializer
+from ddbcereal.streaming import ResponseReader
+
+ITEMS = [
+    {
+        'id': {'S': f'café "{i}" [{{'},
+        'qty': {'N': str(i)},
+        'blob': {'B': 'dGVzdA=='},
+        'level2': {'M': {'tags': {'L': [{'S': ']}'}, {'NULL': True}]}}},
+    }
+    for i in range(50)
+]
+RESPONSE = json.dumps({
+    'Count': 50,
+    'Items': ITEMS,
+    'ScannedCount': 1234,
+    'LastEvaluatedKey': {'id': {'S': 'café "49" [{'}},
+}, ensure_ascii=False).encode()
+
+
+def chunked(data, size):
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 100, 4096, len(RESPONSE)])
+def test_read(chunk_size):
+    deserializer = Deserializer(raw_transport=True)
+    reader = ResponseReader(deserializer)
+    assert (list(reader.read(chunked(RESPONSE, chunk_size)))
+            == deserializer.deserialize_items(ITEMS))
+    assert reader.count == 50
+    assert reader.scanned_count == 1234
+    assert reader.last_evaluated_key == {'id': {'S': 'café "49" [{'}}
+
+
+def test_items_before_end():
+    reader = ResponseReader(Deserializer(raw_transport=True))
+    items = reader.feed(RESPONSE[:len(RESPONSE) // 2])
+    assert 0 < len(items) < 50
+    assert reader.count == 50
+    assert reader.last_evaluated_key is None
+
+
+def test_empty_response():
+    reader = ResponseReader(Deserializer(raw_transport=True))
+    assert reader.feed(b'{"Count": 0, "Items": [], "ScannedCount": 0}') == []
+    assert reader.close() == []
+    assert reader.count == 0
+
+
+def test_incomplete_response():
+    reader = ResponseReader(Deserializer(raw_transport=True))
+    reader.feed(RESPONSE[:-10])
+    with pytest.raises(ValueError):
+        reader.close()